@@ -1,9 +1,30 @@
-from .delta import Delta
-from .global_table import GlobalTable
-from .scheduler import Scheduler
-from .task_handler import TaskHandler
+import importlib
 
+# Submodules are imported on first attribute access so that ``import delta``
+# does not pull in numpy or the Globus SDK until they are needed.
+_exports = {
+    "Delta": ".delta",
+    "GlobalTable": ".global_table",
+    "Scheduler": ".scheduler",
+    "Simulator": ".simulator",
+    "TaskHandler": ".task_handler",
+    "TaskTracker": ".task_tracker",
+}
 
-from .task_tracker import TaskTracker
+__all__ = [
+    "Scheduler",
+    "TaskHandler",
+    "TaskTracker",
+    "GlobalTable",
+    "Delta",
+    "Simulator",
+]
 
-__all__ = ["Scheduler", "TaskHandler", "TaskTracker", "GlobalTable", "Delta"]
+
+def __getattr__(name):
+    module = _exports.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
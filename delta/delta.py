@@ -1,38 +1,77 @@
 import asyncio
 import logging
+import os
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from time import time
 
-import pandas as pd
-from globus_compute_sdk import Client, Executor
-from globus_compute_sdk.serialize import CombinedCode, DillDataBase64
+import numpy as np
 
-
-from .global_table import GlobalTable
-from .scheduler import Scheduler
+from .global_table import CPU_COUNT_ROW, OVERHEAD_ROW, GlobalTable
+from .scheduler import LOCAL_ENDPOINT, Scheduler
 from .task_handler import TaskHandler
 from .task_tracker import TaskTracker
 from .tasks import get_count
 
 
 class Delta:
-    def __init__(self, endpoints, interactive=False):
+    # Weight of the newest batch in the observed runtimes and overheads
+    OBSERVATION_WEIGHT = 0.5
+
+    def __init__(self, endpoints, interactive=False, local=False):
         self.endpoints = endpoints
         self.endpoint_uuids = list(self.endpoints.values())
         self.global_table = GlobalTable(
             interactive=interactive, endpoints=self.endpoint_uuids
         )
-        self.client = Client(
-            code_serialization_strategy=CombinedCode(),
-            data_serialization_strategy=DillDataBase64(),
-        )
+        self.client = self._create_client()
         self.handler = TaskHandler(self.client)
         self.tracker = TaskTracker()
-        self.scheduler = Scheduler(self.global_table)
+        self.scheduler = Scheduler(self.global_table, local=local)
         self.executors = {}
+        self.local_executor = None
+        self._submitted = {}  # Task ID -> (function name, endpoint UUID, time)
+        self._finished = {}  # Task ID -> time its future completed
+        if local:
+            self.local_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+            self.global_table.observations.add_column(LOCAL_ENDPOINT)
+            self._wake_up_local()
 
         # Run the asynchronous initialization
         asyncio.run(self._async_init())
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Shuts down the local process pool, if one was started. Later runs
+        place every task on a remote endpoint.
+        """
+        self.scheduler.local = False
+        if self.local_executor is not None:
+            self.local_executor.shutdown()
+            self.local_executor = None
+
+    @staticmethod
+    def _create_client():
+        """
+        Creates a Globus Compute Client.
+
+        The Globus SDK is imported here rather than at module level so that
+        importing delta stays cheap for short-lived driver scripts.
+        """
+        from globus_compute_sdk import Client
+        from globus_compute_sdk.serialize import CombinedCode, DillDataBase64
+
+        return Client(
+            code_serialization_strategy=CombinedCode(),
+            data_serialization_strategy=DillDataBase64(),
+        )
+
     async def _async_init(self):
         """Asynchronous initialization method."""
         self.executors = await self._initialize_executors()
@@ -45,10 +84,9 @@ class Delta:
         Returns:
         - dict: Mapping from endpoint names to Executor instances.
         """
-        self.client = Client(
-            code_serialization_strategy=CombinedCode(),
-            data_serialization_strategy=DillDataBase64(),
-        )
+        from globus_compute_sdk import Executor
+
+        self.client = self._create_client()
         executors = {}
         for name, uuid in self.endpoints.items():
             executors[name] = Executor(
@@ -91,11 +129,7 @@ class Delta:
             cpu_count = result["result"]
             cpu_counts[ep_uuid] = cpu_count
             # Update observations
-            if "get_count" not in self.global_table.observations.index:
-                self.global_table.observations = self.global_table.observations._append(
-                    pd.Series(name="get_count")
-                )
-            self.global_table.observations.at["get_count", ep_uuid] = cpu_count
+            self.global_table.observations.set(CPU_COUNT_ROW, ep_uuid, cpu_count)
         self.global_table.save_table()
         return cpu_counts  # Return the CPU counts for updating executors
 
@@ -104,17 +138,15 @@ class Delta:
         Initializes or loads the global table, ensuring get_count tasks are completed.
         """
         # Check if 'get_count' exists in the observations; if not, initialize
-        if "get_count" not in self.global_table.observations.index:
-            self.global_table.observations = self.global_table.observations._append(
-                pd.Series(name="get_count")
-            )
+        if CPU_COUNT_ROW not in self.global_table.observations:
+            self.global_table.observations.add_row(CPU_COUNT_ROW)
             self.global_table.save_table()
 
         # Launch get_count tasks for endpoints without observations
         missing_counts = [
             ep_uuid
             for ep_name, ep_uuid in self.endpoints.items()
-            if pd.isna(self.global_table.observations.at["get_count", ep_uuid])
+            if np.isnan(self.global_table.observations.get(CPU_COUNT_ROW, ep_uuid))
         ]
         if missing_counts:
             for ep_uuid in missing_counts:
@@ -222,6 +254,12 @@ class Delta:
             if not endpoint_uuid:
                 logging.warning(f"No placement found for task {task['id']}")
                 continue
+            if endpoint_uuid == LOCAL_ENDPOINT and self.local_executor:
+                future = self.handler.submit_local(
+                    self.local_executor, task["function"], args=task["args"]
+                )
+                self._track_task(task, endpoint_uuid, future)
+                continue
             ep_name = self._get_name_by_uuid(endpoint_uuid)
             if not ep_name:
                 logging.warning(
@@ -233,10 +271,12 @@ class Delta:
                 future = self.handler.submit_task(
                     executor, task["function"], args=task["args"]
                 )
-                self.tracker.add_task(task_id=task["id"], future=future)
+                self._track_task(task, endpoint_uuid, future)
 
         # Collect results
         results = {}
+        runtimes = {}  # (function name, endpoint UUID) -> execution times
+        overheads = {}  # Endpoint UUID -> per-task overheads
         while self.tracker.tasks:
             completed = await self.tracker.get_completed_tasks()
             for task_id, result in completed:
@@ -245,11 +285,98 @@ class Delta:
                         f"Task {task_id} failed with error: {result['error']}"
                     )
                     results[task_id] = None
+                    self._submitted.pop(task_id, None)
+                    self._finished.pop(task_id, None)
                 else:
                     results[task_id] = result["result"]
+                    self._record_task(task_id, result, runtimes, overheads)
             await asyncio.sleep(0.1)  # Short sleep to prevent tight loop
+        self._record_batch(runtimes, overheads)
+        self.global_table.save_table()
         return results
 
+    def _track_task(self, task, endpoint_uuid, future):
+        """
+        Adds a submitted task to the tracker and records when it completes.
+
+        Parameters:
+        - task (dict): The task dictionary.
+        - endpoint_uuid (str): The UUID of the endpoint the task was placed on.
+        - future (Future): The future returned on submission.
+        """
+        task_id = task["id"]
+        self._submitted[task_id] = (task["function"].__name__, endpoint_uuid, time())
+        future.add_done_callback(lambda _: self._finished.setdefault(task_id, time()))
+        self.tracker.add_task(task_id=task_id, future=future)
+
+    def _record_task(self, task_id, result, runtimes, overheads):
+        """
+        Collects the execution time of a completed task and the overhead of
+        the endpoint it ran on.
+
+        Parameters:
+        - task_id (str): The ID of a completed task.
+        - result (dict): Dictionary containing 'result' and 'execution_time'.
+        - runtimes (dict): Execution times by (function name, endpoint UUID).
+        - overheads (dict): Overheads by endpoint UUID.
+        """
+        if task_id not in self._submitted:
+            return  # Not submitted through run, e.g. a wake-up task
+        function_name, ep_uuid, submitted = self._submitted.pop(task_id)
+        finished = self._finished.pop(task_id, time())
+        execution_time = result["execution_time"]
+        runtimes.setdefault((function_name, ep_uuid), []).append(execution_time)
+        overheads.setdefault(ep_uuid, []).append(finished - submitted - execution_time)
+
+    def _record_batch(self, runtimes, overheads):
+        """
+        Updates the observations with the measurements of one batch of tasks.
+
+        Runtimes are summarized by their median. The overhead of a task also
+        includes the time it spent queued behind the rest of the batch, so
+        each endpoint's overhead is taken from the task that waited least.
+
+        Parameters:
+        - runtimes (dict): Execution times by (function name, endpoint UUID).
+        - overheads (dict): Overheads by endpoint UUID.
+        """
+        for (function_name, ep_uuid), samples in runtimes.items():
+            self._observe(function_name, ep_uuid, float(np.median(samples)))
+        for ep_uuid, samples in overheads.items():
+            self._observe(OVERHEAD_ROW, ep_uuid, min(samples))
+
+    def _observe(self, row, ep_uuid, value):
+        """Blend a new measurement into the observations table."""
+        observations = self.global_table.observations
+        previous = observations.get(row, ep_uuid)
+        if not np.isnan(previous):
+            weight = self.OBSERVATION_WEIGHT
+            value = weight * value + (1 - weight) * previous
+        observations.set(row, ep_uuid, value)
+
+    def _wake_up_local(self):
+        """
+        Sends 'get_count' tasks to the local process pool to start its workers
+        and measure the cost of running a task locally.
+        """
+        # The first task pays for starting a worker process, so time the second
+        for _ in range(2):
+            submitted = time()
+            future = self.handler.submit_local(self.local_executor, get_count, args=())
+            result = self.handler.unwrap_result(future)
+            finished = time()
+        if "error" in result:
+            logging.warning(f"Local process pool failed: {result['error']}")
+            return
+        observations = self.global_table.observations
+        observations.set(CPU_COUNT_ROW, LOCAL_ENDPOINT, result["result"])
+        observations.set(
+            OVERHEAD_ROW,
+            LOCAL_ENDPOINT,
+            finished - submitted - result["execution_time"],
+        )
+        self.global_table.save_table()
+
     async def _wake_up_endpoints(self):
         """
         Sends 'get_count' tasks to all endpoints and waits for responses.
@@ -297,11 +424,7 @@ class Delta:
     def _update_global_table(self, ep_name, cpu_count):
         """Update the global table with the new CPU count."""
         ep_uuid = self._get_uuid_by_name(ep_name)
-        if "get_count" not in self.global_table.observations.index:
-            self.global_table.observations = self.global_table.observations._append(
-                pd.Series(name="get_count")
-            )
-        self.global_table.observations.at["get_count", ep_uuid] = cpu_count
+        self.global_table.observations.set(CPU_COUNT_ROW, ep_uuid, cpu_count)
         self.global_table.save_table()
 
     def _get_endpoint_name_from_future(self, future):
@@ -1,11 +1,205 @@
+import csv
+import math
 import os
 
-import pandas as pd
+import numpy as np
 
-"""
-TO-DO
-convert to numpy format
-"""
+# Observation rows that describe endpoints rather than function runtimes
+CPU_COUNT_ROW = "get_count"
+SUBMIT_LATENCY_ROW = "submit_latency"
+TRANSFER_LATENCY_ROW = "transfer_latency"
+OVERHEAD_ROW = "overhead"  # Round trip time minus execution and queueing time
+ENDPOINT_ROWS = (CPU_COUNT_ROW, SUBMIT_LATENCY_ROW, TRANSFER_LATENCY_ROW, OVERHEAD_ROW)
+
+
+class ArrayTable:
+    """
+    Dense float table with dict-based row and column indexes.
+
+    Values are stored in a 2D numpy array; empty cells are NaN. Rows are
+    appended by geometric resizing of the backing array, so repeated
+    ``add_row`` calls are amortized O(1). CSV files are read and written with
+    the csv module; pandas is only imported by ``to_dataframe``.
+    """
+
+    def __init__(self, columns=(), fill=np.nan, capacity=8):
+        """
+        Initializes an empty ArrayTable.
+
+        Parameters:
+        - columns (iterable): Column labels (endpoint UUIDs).
+        - fill (float): Default value for cells of newly added rows.
+        - capacity (int): Initial number of preallocated rows.
+        """
+        self.fill = fill
+        self.columns = {}  # Column label -> column position
+        self.index = {}  # Row label -> row position
+        self.row_labels = []
+        self.column_labels = []
+        self._data = np.full((max(capacity, 1), 0), np.nan)
+        for col in columns:
+            self.add_column(col, fill=fill)
+
+    @property
+    def shape(self):
+        return len(self.row_labels), len(self.column_labels)
+
+    @property
+    def empty(self):
+        return not self.row_labels or not self.column_labels
+
+    @property
+    def values(self):
+        """View of the populated part of the backing array."""
+        return self._data[: len(self.row_labels)]
+
+    def __contains__(self, row):
+        return row in self.index
+
+    def __len__(self):
+        return len(self.row_labels)
+
+    def _grow(self, n_rows):
+        capacity = self._data.shape[0]
+        if n_rows <= capacity:
+            return
+        while capacity < n_rows:
+            capacity *= 2
+        data = np.full((capacity, self._data.shape[1]), np.nan)
+        data[: len(self.row_labels)] = self.values
+        self._data = data
+
+    def add_row(self, row, fill=None):
+        """
+        Appends a row if it does not exist yet.
+
+        Parameters:
+        - row (str): Row label (function name).
+        - fill (float): Initial value for the row; defaults to the table fill.
+
+        Returns:
+        - int: Position of the row.
+        """
+        pos = self.index.get(row)
+        if pos is not None:
+            return pos
+        pos = len(self.row_labels)
+        self._grow(pos + 1)
+        self._data[pos] = self.fill if fill is None else fill
+        self.index[row] = pos
+        self.row_labels.append(row)
+        return pos
+
+    def add_column(self, col, fill=None):
+        """
+        Appends a column if it does not exist yet.
+
+        Parameters:
+        - col (str): Column label (endpoint UUID).
+        - fill (float): Initial value for the column; defaults to the table fill.
+
+        Returns:
+        - int: Position of the column.
+        """
+        pos = self.columns.get(col)
+        if pos is not None:
+            return pos
+        pos = len(self.column_labels)
+        value = self.fill if fill is None else fill
+        column = np.full((self._data.shape[0], 1), np.nan)
+        column[: len(self.row_labels)] = value
+        self._data = np.hstack([self._data, column])
+        self.columns[col] = pos
+        self.column_labels.append(col)
+        return pos
+
+    def get(self, row, col, default=np.nan):
+        """
+        Returns the value at (row, col), or ``default`` if the row is missing.
+        """
+        pos = self.index.get(row)
+        if pos is None:
+            return default
+        return self._data[pos, self.columns[col]]
+
+    def set(self, row, col, value):
+        """
+        Sets the value at (row, col), adding the row if necessary.
+        """
+        pos = self.add_row(row)  # May reallocate the backing array
+        self._data[pos, self.columns[col]] = value
+
+    def row(self, row):
+        """
+        Returns a view of the values of a row, ordered like ``column_labels``.
+        """
+        return self._data[self.index[row], : len(self.column_labels)]
+
+    def fill_rows_with_mean(self):
+        """
+        Replaces NaN cells with the mean of the non-empty cells of their row.
+        Rows without any value are left untouched.
+
+        Returns:
+        - bool: True if any cell was filled.
+        """
+        values = self.values
+        missing = np.isnan(values)
+        if not missing.any():
+            return False
+        counts = (~missing).sum(axis=1)
+        sums = np.where(missing, 0.0, values).sum(axis=1)
+        means = np.divide(
+            sums, counts, out=np.full(len(sums), np.nan), where=counts > 0
+        )
+        rows, cols = np.nonzero(missing)
+        values[rows, cols] = means[rows]
+        return True
+
+    def to_dataframe(self):
+        """
+        Exports the table as a pandas DataFrame.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(
+            self.values.copy(), index=list(self.row_labels), columns=self.column_labels
+        )
+
+    def to_csv(self, path):
+        """
+        Writes the table in the layout of ``DataFrame.to_csv``: a header of
+        column labels after an empty cell, then one line per row with its
+        label first. Empty cells are written as empty strings.
+        """
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow([""] + self.column_labels)
+            for label, values in zip(self.row_labels, self.values.tolist()):
+                writer.writerow(
+                    [label] + ["" if math.isnan(value) else value for value in values]
+                )
+
+    @classmethod
+    def from_csv(cls, path, fill=np.nan):
+        """
+        Loads a table written by ``to_csv`` (row labels in the first column).
+
+        Raises:
+        - FileNotFoundError: If the file does not exist.
+        """
+        with open(path, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, [""])
+            table = cls(columns=header[1:], fill=fill)
+            for line in reader:
+                if not line:
+                    continue
+                pos = table.add_row(line[0], fill=np.nan)
+                for col, cell in enumerate(line[1 : len(header)]):
+                    if cell != "":
+                        table._data[pos, col] = float(cell)
+        return table
 
 
 class GlobalTable:
@@ -33,7 +227,7 @@ class GlobalTable:
 
     def initialize_predictions(self):
         try:
-            predictions = pd.read_csv(self.predictions_path, index_col=0)
+            predictions = ArrayTable.from_csv(self.predictions_path, fill=1.0)
             if self.interactive:
                 self.add_endpoints(predictions, data_type="predictions")
             return predictions
@@ -42,7 +236,7 @@ class GlobalTable:
 
     def initialize_observations(self):
         try:
-            observations = pd.read_csv(self.observations_path, index_col=0)
+            observations = ArrayTable.from_csv(self.observations_path)
             if self.interactive:
                 self.add_endpoints(observations, data_type="observations")
             return observations
@@ -61,7 +255,7 @@ class GlobalTable:
             ).split(",")
             new_eps = [ep.strip() for ep in new_eps if ep.strip()]
             for ep in new_eps:
-                table[ep] = 1 if data_type == "predictions" else {}
+                table.add_column(ep)
             table.to_csv(
                 self.predictions_path
                 if data_type == "predictions"
@@ -83,13 +277,11 @@ class GlobalTable:
         if not new_eps:
             raise ValueError("No endpoints provided and interactive mode is False.")
         if data_type == "predictions":
-            table = pd.DataFrame(
-                1.0, index=[], columns=new_eps
+            table = ArrayTable(
+                columns=new_eps, fill=1.0
             )  # Initialize predictions uniformly
         else:
-            table = pd.DataFrame(
-                {}, index=[], columns=new_eps
-            )  # Initialize empty observations
+            table = ArrayTable(columns=new_eps)  # Initialize empty observations
         os.makedirs(self.config_path, exist_ok=True)
         table.to_csv(
             self.predictions_path
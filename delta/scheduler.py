@@ -1,28 +1,116 @@
+import pickle
+from typing import Callable
+
 import numpy as np
-import pandas as pd
+
+from .global_table import CPU_COUNT_ROW, OVERHEAD_ROW
+
+# Placement target for tasks run in a process pool on the driver host
+LOCAL_ENDPOINT = "local"
+
+
+def _is_picklable(fn):
+    """
+    Checks whether a function can be sent to a local process pool. Lambdas and
+    closures cannot, although the remote dill serializer accepts them.
+    """
+    try:
+        pickle.dumps(fn)
+    except Exception:
+        return False
+    return True
 
 
 class Scheduler:
-    def __init__(self, global_table):
+    def __init__(self, global_table, local=False):
         """
         Initializes the Scheduler with the GlobalTable.
 
         Parameters:
         - global_table (GlobalTable): An instance of the GlobalTable class.
+        - local (bool): If True, tasks may be placed on LOCAL_ENDPOINT.
         """
         self.global_table = global_table  # Instance of GlobalTable
+        self.local = local
 
     def update_predictions(self):
         """
         Fill empty prediction entries with the mean of non-empty values for each function.
         """
-        if not self.global_table.predictions.empty:
-            # Assuming each function is a row and endpoints are columns with probabilities
-            self.global_table.predictions.fillna(
-                self.global_table.predictions.mean(axis=1), inplace=True
-            )
+        predictions = self.global_table.predictions
+        if not predictions.empty and predictions.fill_rows_with_mean():
             self.global_table.save_table()
 
+    def _local_costs(self):
+        """
+        Returns the measured costs that decide whether a task runs locally.
+
+        Returns:
+        - tuple or None: (local overhead, cheapest remote overhead, local
+          workers), or None if either overhead has not been measured yet.
+        """
+        observations = self.global_table.observations
+        if (
+            LOCAL_ENDPOINT not in observations.columns
+            or OVERHEAD_ROW not in observations
+        ):
+            return None
+        local = observations.columns[LOCAL_ENDPOINT]
+        remote = [
+            pos for col, pos in observations.columns.items() if col != LOCAL_ENDPOINT
+        ]
+        overheads = observations.row(OVERHEAD_ROW)
+        remote_overheads = overheads[remote]
+        if np.isnan(overheads[local]) or np.isnan(remote_overheads).all():
+            return None
+        workers = observations.get(CPU_COUNT_ROW, LOCAL_ENDPOINT)
+        workers = 1 if np.isnan(workers) else max(int(workers), 1)
+        return overheads[local], np.nanmin(remote_overheads), workers
+
+    def _predicted_runtime(self, function_name):
+        """
+        Returns the observed local execution time of a function, or its mean
+        over the endpoints that have run it, or None if it was never observed.
+        """
+        observations = self.global_table.observations
+        if function_name not in observations:
+            return None
+        runtime = observations.get(function_name, LOCAL_ENDPOINT)
+        if not np.isnan(runtime):
+            return runtime
+        runtimes = observations.row(function_name)
+        observed = runtimes[~np.isnan(runtimes)]
+        return observed.mean() if len(observed) else None
+
+    def _count_local(self, function_name, n_tasks, local_costs, local_backlog):
+        """
+        Counts how many tasks of a function should run locally. A task runs
+        locally only if, after the local work already queued, its predicted
+        execution time plus the local overhead is below the cheapest remote
+        overhead, i.e. it finishes before a remote round trip could.
+
+        Parameters:
+        - function_name (str): The name of the function.
+        - n_tasks (int): Number of tasks of the function to place.
+        - local_costs (tuple): As returned by _local_costs.
+        - local_backlog (float): Seconds of queued local work per worker.
+
+        Returns:
+        - tuple: Number of tasks to run locally and the updated backlog.
+        """
+        runtime = self._predicted_runtime(function_name)
+        if runtime is None:
+            return 0, local_backlog
+        local_overhead, remote_overhead, workers = local_costs
+        n_local = 0
+        while (
+            n_local < n_tasks
+            and local_backlog + runtime + local_overhead < remote_overhead
+        ):
+            local_backlog += runtime / workers
+            n_local += 1
+        return n_local, local_backlog
+
     def schedule_tasks(self, tasks: list):
         """
         Schedule tasks based on the predictions in the global table.
@@ -33,18 +121,46 @@ class Scheduler:
         Returns:
         - placement (dict): Mapping from task IDs to endpoint UUIDs.
         """
-        placement = {}
+        predictions = self.global_table.predictions
+        endpoints = np.asarray(predictions.column_labels, dtype=object)
+        # Group tasks by function so each group needs a single random draw
+        groups: dict[str, list] = {}
+        functions: dict[str, Callable] = {}
         for task in tasks:
             function_name = task["function"].__name__  # Get function name as string
-            if function_name in self.global_table.predictions.index:
-                probabilities = self.global_table.predictions.loc[function_name].values
-                endpoints = self.global_table.predictions.columns
-                endpoint = np.random.choice(endpoints, p=probabilities)
+            groups.setdefault(function_name, []).append(task["id"])
+            functions.setdefault(function_name, task["function"])
+
+        default = None
+        placement: dict = {}
+        local_costs = self._local_costs() if self.local else None
+        local_backlog = 0.0  # Seconds of queued local work per worker
+        for function_name, task_ids in groups.items():
+            if local_costs is not None and _is_picklable(functions[function_name]):
+                n_local, local_backlog = self._count_local(
+                    function_name, len(task_ids), local_costs, local_backlog
+                )
+                placement.update(
+                    (task_id, LOCAL_ENDPOINT) for task_id in task_ids[:n_local]
+                )
+                task_ids = task_ids[n_local:]
+                if not task_ids:
+                    continue
+            if function_name in predictions:
+                probabilities = predictions.row(function_name)
             else:
-                probabilities = self.global_table.predictions.mean(axis=0).values
-                endpoints = self.global_table.predictions.columns
-                # Normalize probabilities to sum to 1
-                probabilities = probabilities / probabilities.sum()
-                endpoint = np.random.choice(endpoints, p=probabilities)
-            placement[task["id"]] = endpoint
+                if default is None:
+                    # Unknown functions use the mean prediction of each endpoint
+                    default = np.ones(len(endpoints))
+                    if len(predictions):
+                        default = np.nan_to_num(
+                            np.nanmean(predictions.values, axis=0), nan=1.0
+                        )
+                probabilities = default
+            # Normalize probabilities to sum to 1
+            probabilities = probabilities / probabilities.sum()
+            choices = np.random.choice(
+                len(endpoints), size=len(task_ids), p=probabilities
+            )
+            placement.update(zip(task_ids, endpoints[choices].tolist()))
         return placement
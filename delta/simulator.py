@@ -0,0 +1,240 @@
+import csv
+import heapq
+from types import SimpleNamespace
+
+import numpy as np
+
+from .global_table import (
+    CPU_COUNT_ROW,
+    ENDPOINT_ROWS,
+    OVERHEAD_ROW,
+    SUBMIT_LATENCY_ROW,
+    TRANSFER_LATENCY_ROW,
+)
+
+
+class EndpointModel:
+    def __init__(
+        self, uuid, workers=1, runtimes=None, submit_latency=0.0, transfer_latency=0.0
+    ):
+        """
+        Initializes a model of a single endpoint.
+
+        Parameters:
+        - uuid (str): The UUID of the endpoint.
+        - workers (int): Number of tasks the endpoint runs concurrently.
+        - runtimes (dict): Mapping from function names to runtimes in seconds.
+        - submit_latency (float): Delay between submission and a task being queued.
+        - transfer_latency (float): Delay between a task finishing and its result
+          reaching the driver.
+        """
+        self.uuid = uuid
+        self.workers = max(int(workers), 1)
+        self.runtimes = runtimes or {}
+        self.submit_latency = submit_latency
+        self.transfer_latency = transfer_latency
+
+
+def _observed(observations, row, ep_uuid, default):
+    value = observations.get(row, ep_uuid)
+    return default if np.isnan(value) else value
+
+
+def build_endpoint_models(
+    global_table, default_submit_latency=0.0, default_transfer_latency=0.0
+):
+    """
+    Builds endpoint models from the observations in the global table.
+
+    The ``get_count`` row gives the number of workers of each endpoint, and the
+    optional ``submit_latency`` and ``transfer_latency`` rows give per-endpoint
+    latencies in seconds; without a ``submit_latency`` measurement, the
+    round trip ``overhead`` measured by Delta is used instead. Every other row
+    is read as the measured runtime of the function with that name.
+
+    Delta records ``get_count`` and, for tasks submitted through Delta.run,
+    the ``overhead`` row and the function runtimes. Nothing records the
+    ``submit_latency`` and ``transfer_latency`` rows; they must be filled in
+    by hand, and are otherwise taken from the defaults below. Functions with
+    no observed runtime take the simulator's ``default_runtime``.
+
+    Parameters:
+    - global_table (GlobalTable): An instance of the GlobalTable class.
+    - default_submit_latency (float): Used for endpoints without a measurement.
+    - default_transfer_latency (float): Used for endpoints without a measurement.
+
+    Returns:
+    - dict: Mapping from endpoint UUIDs to EndpointModel instances.
+    """
+    observations = global_table.observations
+    functions = [row for row in observations.row_labels if row not in ENDPOINT_ROWS]
+    models = {}
+    for ep_uuid in observations.column_labels:
+        runtimes = {}
+        for function_name in functions:
+            runtime = observations.get(function_name, ep_uuid)
+            if not np.isnan(runtime):
+                runtimes[function_name] = runtime
+        models[ep_uuid] = EndpointModel(
+            ep_uuid,
+            workers=_observed(observations, CPU_COUNT_ROW, ep_uuid, 1),
+            runtimes=runtimes,
+            submit_latency=_observed(
+                observations,
+                SUBMIT_LATENCY_ROW,
+                ep_uuid,
+                _observed(observations, OVERHEAD_ROW, ep_uuid, default_submit_latency),
+            ),
+            transfer_latency=_observed(
+                observations, TRANSFER_LATENCY_ROW, ep_uuid, default_transfer_latency
+            ),
+        )
+    return models
+
+
+def load_trace(path):
+    """
+    Loads a recorded workload from a CSV file with ``arrival`` and ``function``
+    columns.
+
+    Parameters:
+    - path (str): Path to the trace file.
+
+    Returns:
+    - list: List of (arrival_time, function_name) tuples.
+    """
+    with open(path, newline="") as f:
+        return [(float(row["arrival"]), row["function"]) for row in csv.DictReader(f)]
+
+
+class Simulator:
+    def __init__(self, endpoints, scheduler, default_runtime=1.0):
+        """
+        Initializes the Simulator.
+
+        Parameters:
+        - endpoints (dict): Mapping from endpoint UUIDs to EndpointModel instances.
+        - scheduler: Any object with a ``schedule_tasks(tasks)`` method returning
+          a mapping from task IDs to endpoint UUIDs, such as Scheduler.
+        - default_runtime (float): Runtime of functions never observed anywhere.
+        """
+        self.endpoints = endpoints
+        self.scheduler = scheduler
+        self.default_runtime = default_runtime
+
+    def _runtime_matrix(self, function_names, ep_uuids):
+        """
+        Returns runtimes indexed by (function, endpoint). Functions not observed
+        on an endpoint take their mean runtime over the other endpoints.
+        """
+        runtimes = np.full((len(function_names), len(ep_uuids)), np.nan)
+        for j, ep_uuid in enumerate(ep_uuids):
+            observed = self.endpoints[ep_uuid].runtimes
+            for i, function_name in enumerate(function_names):
+                runtimes[i, j] = observed.get(function_name, np.nan)
+        for i in range(len(function_names)):
+            known = runtimes[i][~np.isnan(runtimes[i])]
+            fallback = known.mean() if len(known) else self.default_runtime
+            runtimes[i][np.isnan(runtimes[i])] = fallback
+        return runtimes
+
+    def run(self, trace):
+        """
+        Replays a workload against the endpoint models.
+
+        All tasks are placed by the scheduler up front, as in Delta.run, and
+        each endpoint then serves its tasks first come, first served on its
+        workers.
+
+        Parameters:
+        - trace (list): List of (arrival_time, function_name) tuples.
+
+        Returns:
+        - dict: Makespan, mean and tail latency, and per-endpoint utilization
+          and task counts.
+
+        Raises:
+        - ValueError: If the scheduler leaves a task unplaced or places it on an
+          endpoint without a model.
+        """
+        n = len(trace)
+        ep_uuids = list(self.endpoints)
+        if n == 0:
+            return {
+                "makespan": 0.0,
+                "mean_latency": 0.0,
+                "p50_latency": 0.0,
+                "p95_latency": 0.0,
+                "p99_latency": 0.0,
+                "utilization": {ep_uuid: 0.0 for ep_uuid in ep_uuids},
+                "tasks": {ep_uuid: 0 for ep_uuid in ep_uuids},
+            }
+
+        # Tasks carry a stand-in function so the scheduler sees only its name
+        functions = {}
+        codes = np.empty(n, dtype=np.int64)
+        arrivals = np.empty(n)
+        tasks = []
+        for i, (arrival, function_name) in enumerate(trace):
+            function = functions.get(function_name)
+            if function is None:
+                function = SimpleNamespace(__name__=function_name, code=len(functions))
+                functions[function_name] = function
+            codes[i] = function.code
+            arrivals[i] = arrival
+            tasks.append({"id": i, "function": function})
+
+        placement = self.scheduler.schedule_tasks(tasks)
+        ep_index = {ep_uuid: j for j, ep_uuid in enumerate(ep_uuids)}
+        placed = np.empty(n, dtype=np.int64)
+        for i in range(n):
+            ep_uuid = placement.get(i)
+            j = ep_index.get(ep_uuid)
+            if j is None:
+                if ep_uuid is None:
+                    raise ValueError(
+                        f"Scheduler did not place task {i} ({trace[i][1]})"
+                    )
+                raise ValueError(
+                    f"Task {i} ({trace[i][1]}) placed on endpoint {ep_uuid}, "
+                    "which has no model"
+                )
+            placed[i] = j
+        durations = self._runtime_matrix(list(functions), ep_uuids)[codes, placed]
+
+        completions = np.empty(n)
+        utilization = {}
+        counts = {}
+        order = np.argsort(arrivals, kind="stable")
+        start_time = arrivals.min()
+        busy = np.zeros(len(ep_uuids))
+        for j, ep_uuid in enumerate(ep_uuids):
+            model = self.endpoints[ep_uuid]
+            mine = order[placed[order] == j]
+            counts[ep_uuid] = len(mine)
+            busy[j] = durations[mine].sum()
+            ready = (arrivals[mine] + model.submit_latency).tolist()
+            runtimes = durations[mine].tolist()
+            free = [start_time] * model.workers  # Times at which workers free up
+            finished = []
+            for queued, runtime in zip(ready, runtimes):
+                end = max(queued, free[0]) + runtime
+                heapq.heapreplace(free, end)
+                finished.append(end)
+            completions[mine] = np.asarray(finished) + model.transfer_latency
+
+        makespan = completions.max() - start_time
+        latencies = completions - arrivals
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        for j, ep_uuid in enumerate(ep_uuids):
+            capacity = self.endpoints[ep_uuid].workers * makespan
+            utilization[ep_uuid] = float(busy[j] / capacity) if capacity > 0 else 0.0
+        return {
+            "makespan": float(makespan),
+            "mean_latency": float(latencies.mean()),
+            "p50_latency": float(p50),
+            "p95_latency": float(p95),
+            "p99_latency": float(p99),
+            "utilization": utilization,
+            "tasks": counts,
+        }
@@ -1,7 +1,29 @@
+from __future__ import annotations
+
 from functools import wraps
 from time import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    from globus_compute_sdk import Client, Executor
+
 
-from globus_compute_sdk import Client, Executor
+def _timed_call(fn, *args):
+    """
+    Calls a function and measures its execution time. Defined at module level
+    so that it can be pickled into a local process pool. Exceptions are
+    returned in the same error dictionary as ``unwrap_result``.
+    """
+    start_time = time()
+    try:
+        result = fn(*args)
+    except Exception as e:
+        return {"result": None, "execution_time": None, "error": str(e)}
+    end_time = time()
+    execution_time = end_time - start_time
+    return {"result": result, "execution_time": execution_time}
 
 
 class TaskHandler:
@@ -45,6 +67,20 @@ class TaskHandler:
         future = executor.submit(wrapped_fn, *args)
         return future
 
+    def submit_local(self, pool: ProcessPoolExecutor, fn, args):
+        """
+        Submits a single task to the local process pool.
+
+        Parameters:
+        - pool (ProcessPoolExecutor): The process pool on the driver host.
+        - fn (callable): The function to execute. Must be picklable.
+        - args (tuple): Arguments to pass to the function.
+
+        Returns:
+        - Future: The future object representing the submitted task.
+        """
+        return pool.submit(_timed_call, fn, *args)
+
     def submit_batch(self, executor: Executor, fn, args_list):
         """
         Submits a batch of tasks to the executor.
@@ -1,6 +1,3 @@
-import asyncio
-
-
 class TaskTracker:
     def __init__(self):
         self.tasks = {}
@@ -12,14 +9,21 @@ class TaskTracker:
         """
         Retrieves and removes completed tasks asynchronously.
 
+        Tasks may be tracked with asyncio futures or with concurrent.futures
+        futures, such as those returned by Globus Compute executors and local
+        process pools, so completion is polled with ``done()``.
+
         Returns:
         - list: List of tuples containing task_id and result.
         """
         completed = []
-        done, _ = await asyncio.wait([fut for fut in self.tasks.values()], timeout=0)
-        for future in done:
-            task_id = next(tid for tid, fut in self.tasks.items() if fut == future)
-            result = future.result()
+        for task_id, future in list(self.tasks.items()):
+            if not future.done():
+                continue
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"result": None, "execution_time": None, "error": str(e)}
             completed.append((task_id, result))
             del self.tasks[task_id]
         return completed
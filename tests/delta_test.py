@@ -0,0 +1,86 @@
+import asyncio
+from functools import partial
+
+import numpy as np
+import pytest
+
+import delta.delta as delta_module
+from delta.delta import Delta
+from delta.global_table import CPU_COUNT_ROW, OVERHEAD_ROW, GlobalTable
+from delta.scheduler import LOCAL_ENDPOINT
+
+ENDPOINTS = {"remote": "remote-uuid"}
+
+
+def add(x, y):
+    return x + y
+
+
+def fail():
+    raise RuntimeError("boom")
+
+
+async def _no_endpoints(self):
+    self.executors = {}
+
+
+@pytest.fixture
+def local_delta(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        delta_module, "GlobalTable", partial(GlobalTable, config_path=str(tmp_path))
+    )
+    monkeypatch.setattr(Delta, "_create_client", staticmethod(lambda: None))
+    monkeypatch.setattr(Delta, "_async_init", _no_endpoints)
+    with Delta(ENDPOINTS, local=True) as instance:
+        observations = instance.global_table.observations
+        # Make remote placement look expensive for the functions under test
+        observations.set(OVERHEAD_ROW, "remote-uuid", 10.0)
+        observations.set("add", "remote-uuid", 1.0)
+        observations.set("fail", "remote-uuid", 1.0)
+        yield instance
+    assert instance.local_executor is None
+
+
+def test_local_is_off_by_default(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        delta_module, "GlobalTable", partial(GlobalTable, config_path=str(tmp_path))
+    )
+    monkeypatch.setattr(Delta, "_create_client", staticmethod(lambda: None))
+    monkeypatch.setattr(Delta, "_async_init", _no_endpoints)
+    instance = Delta(ENDPOINTS)
+    assert instance.local_executor is None
+    assert LOCAL_ENDPOINT not in instance.global_table.observations.columns
+
+
+def test_wake_up_local_measures_pool(local_delta):
+    observations = local_delta.global_table.observations
+    assert observations.get(CPU_COUNT_ROW, LOCAL_ENDPOINT) >= 1
+    assert observations.get(OVERHEAD_ROW, LOCAL_ENDPOINT) >= 0
+
+
+def test_run_places_cheap_tasks_locally(local_delta):
+    results = asyncio.run(local_delta.run([(add, (1, 2)), (add, (3, 4))]))
+    assert sorted(results.values()) == [3, 7]
+    observations = local_delta.global_table.observations
+    assert not np.isnan(observations.get("add", LOCAL_ENDPOINT))
+    assert not local_delta._submitted and not local_delta._finished
+
+
+def test_run_reports_local_errors(local_delta):
+    results = asyncio.run(local_delta.run([(fail, ())]))
+    assert list(results.values()) == [None]
+    assert not local_delta._submitted and not local_delta._finished
+
+
+def test_unpicklable_functions_are_not_placed_locally(local_delta):
+    double = lambda x: 2 * x  # noqa: E731
+    local_delta.global_table.observations.set("<lambda>", "remote-uuid", 1.0)
+    tasks = [{"id": 0, "function": double}, {"id": 1, "function": add}]
+    placement = local_delta.scheduler.schedule_tasks(tasks)
+    assert placement == {0: "remote-uuid", 1: LOCAL_ENDPOINT}
+
+
+def test_close_disables_local_placement(local_delta):
+    local_delta.close()
+    tasks = [{"id": 0, "function": add}]
+    assert local_delta.scheduler.schedule_tasks(tasks) == {0: "remote-uuid"}
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from delta.global_table import ArrayTable, GlobalTable
+
+
+def test_add_row_grows_past_capacity():
+    table = ArrayTable(columns=["a", "b"], fill=1.0, capacity=2)
+    for i in range(5):
+        table.set(f"f{i}", "b", float(i))
+    assert table.shape == (5, 2)
+    assert table._data.shape[0] == 8
+    assert table.row_labels == [f"f{i}" for i in range(5)]
+    np.testing.assert_array_equal(table.values[:, 0], np.ones(5))
+    np.testing.assert_array_equal(table.values[:, 1], np.arange(5.0))
+
+
+def test_add_row_is_idempotent():
+    table = ArrayTable(columns=["a"])
+    assert table.add_row("f") == table.add_row("f") == 0
+    assert len(table) == 1
+
+
+def test_add_column_to_populated_table():
+    table = ArrayTable(columns=["a"], fill=1.0, capacity=1)
+    table.set("f", "a", 2.0)
+    table.set("g", "a", 3.0)
+    table.add_column("b", fill=5.0)
+    table.add_column("c")
+    np.testing.assert_array_equal(table.row("f"), [2.0, 5.0, 1.0])
+    np.testing.assert_array_equal(table.row("g"), [3.0, 5.0, 1.0])
+    # Rows added later pick up the table fill in every column
+    table.add_row("h")
+    np.testing.assert_array_equal(table.row("h"), [1.0, 1.0, 1.0])
+
+
+def test_get_missing_row_returns_default():
+    table = ArrayTable(columns=["a"])
+    assert np.isnan(table.get("f", "a"))
+    assert table.get("f", "a", default=0.0) == 0.0
+
+
+def test_fill_rows_with_mean_skips_all_nan_rows():
+    table = ArrayTable(columns=["a", "b", "c"])
+    table.set("f", "a", 1.0)
+    table.set("f", "c", 3.0)
+    table.add_row("g")
+    assert table.fill_rows_with_mean()
+    np.testing.assert_array_equal(table.row("f"), [1.0, 2.0, 3.0])
+    assert np.isnan(table.row("g")).all()
+
+
+def test_fill_rows_with_mean_without_missing_cells():
+    table = ArrayTable(columns=["a"], fill=1.0)
+    table.add_row("f")
+    assert not table.fill_rows_with_mean()
+
+
+def test_csv_round_trip_matches_pandas(tmp_path):
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame(
+        [[8.0, np.nan], [0.25, 1.5]], index=["get_count", "f"], columns=["a", "b"]
+    )
+    pandas_path = tmp_path / "pandas.csv"
+    frame.to_csv(pandas_path)
+
+    table = ArrayTable.from_csv(pandas_path)
+    assert table.row_labels == ["get_count", "f"]
+    assert table.column_labels == ["a", "b"]
+    np.testing.assert_array_equal(table.values, frame.values)
+
+    path = tmp_path / "table.csv"
+    table.to_csv(path)
+    assert path.read_text() == pandas_path.read_text()
+    pd.testing.assert_frame_equal(pd.read_csv(path, index_col=0), frame)
+
+
+def test_empty_table_csv_round_trip(tmp_path):
+    path = tmp_path / "table.csv"
+    ArrayTable(columns=["a", "b"]).to_csv(path)
+    table = ArrayTable.from_csv(path)
+    assert table.column_labels == ["a", "b"]
+    assert table.empty
+
+
+def test_global_table_persists_observations(tmp_path):
+    table = GlobalTable(config_path=str(tmp_path), endpoints=["a", "b"])
+    table.observations.set("get_count", "a", 8)
+    table.save_table()
+    reloaded = GlobalTable(config_path=str(tmp_path), endpoints=["a", "b"])
+    assert reloaded.observations.get("get_count", "a") == 8.0
+    assert np.isnan(reloaded.observations.get("get_count", "b"))
+    assert reloaded.predictions.fill == 1.0
@@ -0,0 +1,90 @@
+import numpy as np
+
+from delta.global_table import GlobalTable
+from delta.scheduler import LOCAL_ENDPOINT, Scheduler
+
+
+def example_task(x, y):
+    return x + y
+
+
+def other_task():
+    return None
+
+
+def _tasks(*functions):
+    return [{"id": i, "function": fn} for i, fn in enumerate(functions)]
+
+
+def test_schedule_tasks_with_empty_predictions(tmp_path):
+    table = GlobalTable(config_path=str(tmp_path), endpoints=["a", "b"])
+    placement = Scheduler(table).schedule_tasks(_tasks(example_task, other_task))
+    assert set(placement) == {0, 1}
+    assert set(placement.values()) <= {"a", "b"}
+
+
+def test_schedule_tasks_follows_predictions(tmp_path):
+    table = GlobalTable(config_path=str(tmp_path), endpoints=["a", "b"])
+    table.predictions.set("example_task", "a", 0.0)
+    placement = Scheduler(table).schedule_tasks(_tasks(*[example_task] * 20))
+    assert set(placement.values()) == {"b"}
+
+
+def test_update_predictions_fills_row_mean(tmp_path):
+    table = GlobalTable(config_path=str(tmp_path), endpoints=["a", "b", "c"])
+    table.predictions.set("example_task", "a", 1.0)
+    table.predictions.set("example_task", "b", np.nan)
+    table.predictions.set("example_task", "c", 3.0)
+    Scheduler(table).update_predictions()
+    np.testing.assert_array_equal(table.predictions.row("example_task"), [1, 2, 3])
+
+
+def do_a_test(func_args):
+    return func_args
+
+
+def _local_table(tmp_path, local_workers=2):
+    table = GlobalTable(config_path=str(tmp_path), endpoints=["a", "b"])
+    observations = table.observations
+    observations.add_column(LOCAL_ENDPOINT)
+    observations.set("get_count", LOCAL_ENDPOINT, local_workers)
+    observations.set("overhead", LOCAL_ENDPOINT, 0.01)
+    observations.set("overhead", "a", 0.5)
+    observations.set("overhead", "b", 2.0)
+    return table
+
+
+def test_heavy_functions_stay_remote(tmp_path):
+    table = _local_table(tmp_path)
+    table.observations.set("do_a_test", "a", 3600.0)
+    placement = Scheduler(table, local=True).schedule_tasks(
+        _tasks(*[do_a_test] * 10000)
+    )
+    assert LOCAL_ENDPOINT not in placement.values()
+
+
+def test_local_share_is_capped_by_pool_capacity(tmp_path):
+    table = _local_table(tmp_path, local_workers=2)
+    table.observations.set("example_task", "a", 0.1)
+    placement = Scheduler(table, local=True).schedule_tasks(
+        _tasks(*[example_task] * 100)
+    )
+    # Each local task adds 0.05 s per worker; the 0.5 s round trip allows 8
+    assert list(placement.values()).count(LOCAL_ENDPOINT) == 8
+    assert set(placement.values()) == {LOCAL_ENDPOINT, "a", "b"}
+
+
+def test_local_backlog_is_shared_across_functions(tmp_path):
+    table = _local_table(tmp_path, local_workers=1)
+    table.observations.set("example_task", LOCAL_ENDPOINT, 0.2)
+    table.observations.set("other_task", LOCAL_ENDPOINT, 0.2)
+    placement = Scheduler(table, local=True).schedule_tasks(
+        _tasks(*[example_task, other_task] * 5)
+    )
+    assert list(placement.values()).count(LOCAL_ENDPOINT) == 2
+
+
+def test_unobserved_functions_stay_remote(tmp_path):
+    table = _local_table(tmp_path)
+    placement = Scheduler(table, local=True).schedule_tasks(_tasks(example_task))
+    assert placement[0] in {"a", "b"}
@@ -0,0 +1,147 @@
+import numpy as np
+import pytest
+
+from delta.global_table import GlobalTable
+from delta.scheduler import Scheduler
+from delta.simulator import EndpointModel, Simulator, build_endpoint_models
+
+
+class FixedScheduler:
+    """Places every task on the endpoint given for its function."""
+
+    def __init__(self, placement):
+        self.placement = placement
+
+    def schedule_tasks(self, tasks):
+        return {task["id"]: self.placement[task["function"].__name__] for task in tasks}
+
+
+def _simulator(workers, scheduler=None):
+    endpoints = {
+        "a": EndpointModel(
+            "a",
+            workers=workers,
+            runtimes={"f": 2.0},
+            submit_latency=0.5,
+            transfer_latency=0.25,
+        )
+    }
+    return Simulator(endpoints, scheduler or FixedScheduler({"f": "a"}))
+
+
+def test_fcfs_single_worker():
+    result = _simulator(workers=1).run([(0.0, "f"), (0.0, "f"), (1.0, "f")])
+    # Tasks start at 0.5, 2.5 and 4.5 and reach the driver 2.25 s later
+    assert result["makespan"] == pytest.approx(6.75)
+    assert result["mean_latency"] == pytest.approx((2.75 + 4.75 + 5.75) / 3)
+    assert result["p50_latency"] == pytest.approx(4.75)
+    assert result["utilization"]["a"] == pytest.approx(6.0 / 6.75)
+    assert result["tasks"] == {"a": 3}
+
+
+def test_fcfs_two_workers():
+    result = _simulator(workers=2).run([(0.0, "f"), (0.0, "f"), (1.0, "f")])
+    # The third task waits for a worker to free up at 2.5
+    assert result["makespan"] == pytest.approx(4.75)
+    assert result["mean_latency"] == pytest.approx((2.75 + 2.75 + 3.75) / 3)
+    assert result["utilization"]["a"] == pytest.approx(6.0 / (2 * 4.75))
+
+
+def test_trace_order_does_not_matter():
+    trace = [(1.0, "f"), (0.0, "f"), (0.0, "f")]
+    result = _simulator(workers=1).run(trace)
+    assert result["makespan"] == pytest.approx(6.75)
+    assert result["mean_latency"] == pytest.approx((2.75 + 4.75 + 5.75) / 3)
+
+
+def test_empty_trace():
+    result = _simulator(workers=1).run([])
+    assert result["makespan"] == 0.0
+    assert result["mean_latency"] == 0.0
+    assert result["utilization"] == {"a": 0.0}
+    assert result["tasks"] == {"a": 0}
+
+
+def test_runtime_matrix_falls_back_to_mean():
+    endpoints = {
+        "a": EndpointModel("a", runtimes={"f": 1.0}),
+        "b": EndpointModel("b", runtimes={"f": 3.0}),
+        "c": EndpointModel("c"),
+    }
+    simulator = Simulator(endpoints, FixedScheduler({}), default_runtime=7.0)
+    runtimes = simulator._runtime_matrix(["f", "g"], ["a", "b", "c"])
+    np.testing.assert_array_equal(runtimes, [[1.0, 3.0, 2.0], [7.0, 7.0, 7.0]])
+
+
+def test_build_endpoint_models_skips_endpoint_rows(tmp_path):
+    table = GlobalTable(config_path=str(tmp_path), endpoints=["a", "b"])
+    observations = table.observations
+    observations.set("get_count", "a", 4)
+    observations.set("submit_latency", "a", 0.5)
+    observations.set("transfer_latency", "a", 0.25)
+    observations.set("overhead", "b", 0.75)
+    observations.set("f", "a", 2.0)
+    models = build_endpoint_models(table, default_transfer_latency=0.1)
+
+    assert models["a"].workers == 4
+    assert models["a"].runtimes == {"f": 2.0}
+    assert models["a"].submit_latency == 0.5
+    assert models["a"].transfer_latency == 0.25
+    assert models["b"].workers == 1
+    assert models["b"].runtimes == {}
+    assert models["b"].submit_latency == 0.75
+    assert models["b"].transfer_latency == 0.1
+
+
+def test_unplaced_task_raises():
+    simulator = _simulator(workers=1, scheduler=FixedScheduler({"f": None}))
+    with pytest.raises(ValueError, match="did not place task 0"):
+        simulator.run([(0.0, "f")])
+
+
+def test_placement_without_model_raises():
+    simulator = _simulator(workers=1, scheduler=FixedScheduler({"f": "z"}))
+    with pytest.raises(ValueError, match="endpoint z"):
+        simulator.run([(0.0, "f")])
+
+
+def _replay_with_scheduler(table, trace, seed):
+    np.random.seed(seed)
+    return Simulator(build_endpoint_models(table), Scheduler(table)).run(trace)
+
+
+def test_simulator_drives_real_scheduler(tmp_path):
+    table = GlobalTable(config_path=str(tmp_path), endpoints=["a", "b", "c"])
+    table.predictions.set("f", "a", 0.0)
+    table.predictions.set("f", "c", 3.0)
+    for ep_uuid, workers in zip("abc", (4, 2, 8)):
+        table.observations.set("get_count", ep_uuid, workers)
+        table.observations.set("f", ep_uuid, 0.5)
+    table.observations.set("g", "b", 2.0)
+    trace = [(i * 0.01, "f") for i in range(1000)] + [(0.0, "g")] * 100
+
+    result = _replay_with_scheduler(table, trace, seed=0)
+    assert result == _replay_with_scheduler(table, trace, seed=0)
+
+    counts = result["tasks"]
+    assert sum(counts.values()) == len(trace)
+    # Unknown functions like g use the mean prediction, which is zero for a too
+    assert counts["a"] == 0
+    assert counts["b"] > 0 and counts["c"] > 0
+    assert result["p50_latency"] <= result["p95_latency"] <= result["p99_latency"]
+    assert 0 < result["mean_latency"] <= result["makespan"]
+    for ep_uuid, utilization in result["utilization"].items():
+        assert 0.0 <= utilization <= 1.0
+        assert (utilization == 0.0) == (counts[ep_uuid] == 0)
+
+
+def test_simulator_respects_zero_probability_endpoint(tmp_path):
+    table = GlobalTable(config_path=str(tmp_path), endpoints=["a", "b"])
+    table.predictions.set("f", "a", 0.0)
+    table.observations.set("f", "b", 1.0)
+    result = _replay_with_scheduler(table, [(0.0, "f")] * 500, seed=1)
+    assert result["tasks"] == {"a": 0, "b": 500}
+    assert result["utilization"]["a"] == 0.0
+    # One worker runs 500 one-second tasks back to back
+    assert result["makespan"] == pytest.approx(500.0)
+    assert result["utilization"]["b"] == pytest.approx(1.0)